@@ -35,41 +35,57 @@ from sphinx.util.docutils import SphinxRole
 from docutils.parsers.rst.states import Struct
 from sphinx.util.nodes import nodes
 from typing import Dict, Union
-import re
+import functools
 from kas.configschema import CONFIGSCHEMA, __schema_definition__
 
 
+def _parse_part(part: str) -> tuple[str, Union[int, None]]:
+    '''
+        Splits a path component of the form ``name`` or ``name[index]``.
+        Raises a KeyError if the component is malformed.
+    '''
+    i = part.find('[')
+    if i < 0:
+        name, index = part, None
+    elif part.endswith(']') and part[i + 1:-1].isdigit():
+        name, index = part[:i], int(part[i + 1:-1])
+    else:
+        raise KeyError(part)
+    if not name:
+        raise KeyError(part)
+    return name, index
+
+
+@functools.lru_cache(maxsize=None)
+def _resolve_schema_node(path: str) -> dict:
+    '''
+        Returns the schema node addressed by the dot-separated path.
+        Raises a KeyError if the path cannot be resolved.
+    '''
+    node = CONFIGSCHEMA['properties']
+    for part in path.split('.'):
+        name, index = _parse_part(part)
+        node = node[name] if index is None else node[name][index]
+    return node
+
+
 class KasSchemaDescRole(SphinxRole):
 
     required_arguments = 1
 
-    def __init__(self):
-        super().__init__()
-        self.key_regex = re.compile(r'([a-zA-Z_]+)(?:\[(\d+)\])?')
-
     def run(self) -> tuple[list[nodes.Node], list[nodes.system_message]]:
         messages = []
-        node = CONFIGSCHEMA['properties']
-        path = self.text.split('.')
         self.env.note_dependency(__schema_definition__)
         try:
-            for part in path:
-                match = self.key_regex.match(part).groups()
-                if match[1]:
-                    node = node[match[0]][int(match[1])]
-                elif match[0]:
-                    node = node[match[0]]
-                else:
-                    raise KeyError
+            node = _resolve_schema_node(self.text)
         except KeyError:
             messages.append(self.inliner.document.reporter.error(
                 f'Invalid path: {self.text}',
                 line=self.lineno,
             ))
             return [], messages
-        try:
-            desc = node['description']
-        except KeyError:
+        desc = node.get('description', None)
+        if desc is None:
             messages.append(self.inliner.document.reporter.error(
                 f'Description missing for path: {self.text}',
                 line=self.lineno,
@@ -85,10 +101,9 @@ class KasSchemaDescRole(SphinxRole):
         parent += processed
         messages += msgs
         if default:
-            def_pg = nodes.paragraph()
-            def_pg += nodes.strong(text='Default: ')
-            def_pg += nodes.literal(text=default)
-            parent += def_pg
+            parent += nodes.paragraph('', '',
+                                      nodes.strong(text='Default: '),
+                                      nodes.literal(text=default))
 
         return parent, messages
 
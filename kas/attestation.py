@@ -25,13 +25,17 @@
 """
 
 import os
+import re
 import distro
+import functools
 import logging
 import hashlib
 import base64
+import json
+import ssl
 import sys
 from enum import Enum
-from urllib.parse import urlparse
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from datetime import datetime, timezone
 from kas import __version__ as KASVERSION
@@ -42,11 +46,23 @@ KAS_BUILDER_ID = 'https://github.com/siemens/kas'
 KAS_BUILD_TYPE = 'https://kas.readthedocs.io/en' \
                  f'/{KASVERSION}/userguide/project-configuration.html'
 INTOTO_STATEMENT_TYPE = 'https://in-toto.io/Statement/v1'
+# user:password@ part of http(s) urls
+CREDENTIALS_REGEX = re.compile(r'^(https?://)[^/?#@:]+:[^/?#]+@')
 
 
 def date_to_rfc3339(dt):
-    return dt.astimezone(timezone.utc) \
-             .strftime('%Y-%m-%dT%H:%M:%S.%fZ')
+    dt = dt.astimezone(timezone.utc)
+    return f'{dt.year:04d}-{dt.month:02d}-{dt.day:02d}T' \
+           f'{dt.hour:02d}:{dt.minute:02d}:{dt.second:02d}.' \
+           f'{dt.microsecond:06d}Z'
+
+
+@functools.lru_cache(maxsize=None)
+def get_distro_info():
+    """
+        Returns the id and version of the host distribution.
+    """
+    return (distro.id(), distro.version())
 
 
 def file_digest_slow(f, algorithm):
@@ -54,11 +70,13 @@ def file_digest_slow(f, algorithm):
         Implementation of hashlib.file_digest for python < 3.11
     """
     hash = hashlib.new(algorithm)
+    buf = bytearray(2**20)
+    view = memoryview(buf)
     while True:
-        data = f.read()
-        if not data:
+        size = f.readinto(buf)
+        if not size:
             break
-        hash.update(data)
+        hash.update(view[:size])
     return hash
 
 
@@ -91,12 +109,7 @@ class Provenance:
         """
             Returns the url with all credentials removed (best effort)
         """
-        if not url.startswith('http://') and not url.startswith('https://'):
-            return url
-        parsed = urlparse(url)
-        if parsed.username and parsed.password:
-            url = url.replace(f'{parsed.username}:{parsed.password}@', '')
-        return url
+        return CREDENTIALS_REGEX.sub(r'\1', url, count=1)
 
     @staticmethod
     def _get_filetype(f: Path):
@@ -125,9 +138,10 @@ class Provenance:
                 if not r.url or not r.revision:
                     continue
             digest = {f'{r.get_type()}Commit': r.revision}
+            repo_path = Path(r.path)
             annotations = {
                 'dirty': r.dirty,
-                'layers': [str(Path(layer).relative_to(r.path))
+                'layers': [str(Path(layer).relative_to(repo_path))
                            for layer in r.layers]
             }
             cleanurl = self._strip_credentials(r.url)
@@ -138,21 +152,25 @@ class Provenance:
                 'annotations': annotations
             }
             res_deps.append(dep)
-            tracked_repos.append(r)
+            tracked_repos.append((r, os.path.realpath(r.path) + os.sep))
 
         # (abspath, relpath)
-        config_files = [(Path(c), self._make_relative_path(Path(c)))
+        config_files = [(Path(c), str(self._make_relative_path(Path(c))))
                         for c in self._ctx.config.filenames]
+        # check more specific (nested) repos first
+        tracked_repos.sort(key=lambda t: len(t[1]), reverse=True)
         for ca, cr in config_files:
-            if any([r.contains_path(cr) for r in tracked_repos]):
+            # only query repos the config file is located in
+            ca_real = os.path.realpath(ca)
+            if any(r.contains_path(cr) for r, r_real in tracked_repos
+                   if ca_real.startswith(r_real)):
                 logging.debug(f'Config file {cr} is tracked')
                 continue
 
-            with open(ca, 'rb') as f:
-                content = f.read()
+            content = base64.b64encode(ca.read_bytes())
             rd = {
-                'name': str(cr),
-                'content': base64.b64encode(content).decode('utf-8'),
+                'name': cr,
+                'content': content.decode('utf-8'),
                 'mediaType': f'application/vnd.kas+{self._get_filetype(ca)}'
             }
             res_deps.append(rd)
@@ -161,7 +179,7 @@ class Provenance:
             'buildType': KAS_BUILD_TYPE,
             'externalParameters': {
                 'command': self._ctx.args.cmd,
-                'config': [str(c) for _, c in config_files],
+                'config': [c for _, c in config_files],
                 'target': self._ctx.args.target,
                 'task': self._ctx.args.task,
                 'extra_bitbake_args': self._ctx.args.extra_bitbake_args,
@@ -172,10 +190,11 @@ class Provenance:
         if self._mode == self.Mode.MAX:
             bd['internalParameters']['env'] = \
                 self._ctx.config.get_environment()
+        (distro_id, distro_version) = get_distro_info()
         b_versions = {
             'kas': KASVERSION,
-            'distro.name': distro.id(),
-            'distro.version': distro.version()
+            'distro.name': distro_id,
+            'distro.version': distro_version
         }
 
         rd = {
@@ -207,38 +226,52 @@ class Statement:
         self._ctx = ctx
         self._t_started = t_started
         self._t_finished = t_finished
+        self._ts_started = t_started.timestamp()
+        self._ts_finished = t_finished.timestamp()
+        self._build_dir = Path(ctx.build_dir)
 
-    def _check_artifact_timestamp(self, name, path):
+    def _check_artifact_timestamp(self, name, path, fullpath):
         """
             Warn if artifact timestamp is not within the build range.
         """
         logging.debug(f'Found artifact {name}:{path} in build dir')
-        fullpath = Path(self._ctx.build_dir) / path
-        mtime = datetime.fromtimestamp(fullpath.stat().st_mtime)
-        if mtime < self._t_started or mtime > self._t_finished:
+        mtime = fullpath.stat().st_mtime
+        if mtime < self._ts_started or mtime > self._ts_finished:
+            mtime = datetime.fromtimestamp(mtime)
             logging.warning(
                 f'Artifact {name}:{path.name} mtime {mtime.strftime("%c")}'
                 f' not in build range '
                 f'[{self._t_started.strftime("%c")} - '
                 f'{self._t_finished.strftime("%c")}]')
 
+    def _hash_artifact(self, name, path):
+        """
+            Returns the subject entry of a single artifact.
+        """
+        fullpath = self._build_dir / path
+        self._check_artifact_timestamp(name, path, fullpath)
+        with open(fullpath, "rb", buffering=0) as f:
+            if sys.version_info < (3, 11):
+                digest = file_digest_slow(f, "sha256")
+            else:
+                digest = hashlib.file_digest(f, "sha256")
+        return {
+            'name': path.name,
+            'digest': {'sha256': digest.hexdigest()}
+        }
+
     def as_dict(self):
         pt = self._predicate.type_()
         pp = self._predicate.as_dict()
+        artifacts = self._ctx.config.get_artifacts(missing_ok=False)
         subjects = []
-        for n, s in self._ctx.config.get_artifacts(missing_ok=False):
-            self._check_artifact_timestamp(n, s)
-            fullpath = Path(self._ctx.build_dir) / s
-            with open(fullpath, "rb") as f:
-                if sys.version_info < (3, 11):
-                    digest = file_digest_slow(f, "sha256")
-                else:
-                    digest = hashlib.file_digest(f, "sha256")
-            rd = {
-                'name': s.name,
-                'digest': {'sha256': digest.hexdigest()}
-            }
-            subjects.append(rd)
+        if artifacts:
+            logging.debug(f'Hashing artifacts using {ssl.OPENSSL_VERSION}')
+            # hashlib releases the GIL while hashing, hence use threads
+            workers = min(os.cpu_count() or 1, len(artifacts))
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                subjects = list(executor.map(lambda a: self._hash_artifact(*a),
+                                             artifacts))
         if len(subjects) == 0:
             logging.warning('Attestation does not contain any artifacts.')
         st = {
@@ -248,3 +281,16 @@ class Statement:
             'predicate': pp
         }
         return st
+
+    def write_json(self, filename):
+        """
+            Serializes the statement as JSON into the given file.
+            The document is written in chunks instead of being assembled
+            as a single string first.
+        """
+        st = self.as_dict()
+        encoder = json.JSONEncoder(indent=4)
+        with open(filename, 'w') as f:
+            for chunk in encoder.iterencode(st):
+                f.write(chunk)
+            f.write('\n')
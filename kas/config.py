@@ -36,27 +36,41 @@ __copyright__ = 'Copyright (c) Siemens AG, 2017-2021'
 
 CONFIG_YAML_FILE = '.config.yaml'
 
+# json.dumps creates a new encoder for every call with non-default options
+_REPO_KEY_ENCODER = json.JSONEncoder(sort_keys=True)
+
+DEFAULT_TARGET = CONFIGSCHEMA['properties']['target']['default']
+DEFAULT_TASK = CONFIGSCHEMA['properties']['task']['default']
+DEFAULT_MACHINE = CONFIGSCHEMA['properties']['machine']['default']
+DEFAULT_DISTRO = CONFIGSCHEMA['properties']['distro']['default']
+
 
 class Config:
     """
         Implements the kas configuration based on config files.
     """
+    __slots__ = ('_override_target', '_override_task', '_build_dir',
+                 '_environ', '_config', 'filenames', 'handler', 'repo_dict',
+                 '_repo_dict_config', 'repo_cfg_hashes')
+
     def __init__(self, ctx, filename, target=None, task=None):
         self._override_target = target
         self._override_task = task
         self._build_dir = ctx.build_dir
+        # snapshot of the environment the configuration is evaluated in
+        self._environ = dict(os.environ)
         self._config = {}
         if not filename:
             filename = os.path.join(ctx.kas_work_dir, CONFIG_YAML_FILE)
 
         self.filenames = [os.path.abspath(configfile)
                           for configfile in filename.split(':')]
-        top_repo_path = Repo.get_root_path(
-            os.path.dirname(self.filenames[0]))
-
-        repo_paths = [Repo.get_root_path(os.path.dirname(configfile),
-                                         fallback=False)
-                      for configfile in self.filenames]
+        config_dirs = [os.path.dirname(configfile)
+                       for configfile in self.filenames]
+        repo_paths = [Repo.get_root_path(config_dir, fallback=False)
+                      for config_dir in config_dirs]
+        # same as get_root_path with fallback, without a second lookup
+        top_repo_path = repo_paths[0] or config_dirs[0]
 
         if len(set(repo_paths)) > 1:
             raise IncludeException('All concatenated config files must '
@@ -69,6 +83,7 @@ class Config:
                                       top_repo_path,
                                       not update)
         self.repo_dict = self._get_repo_dict()
+        self._repo_dict_config = self._config
         self.repo_cfg_hashes = {}
 
     def get_build_system(self):
@@ -104,8 +119,11 @@ class Config:
         """
 
         # Always keep repo_dict and repos synchronous
-        # when calling get_repos
-        self.repo_dict = self._get_repo_dict()
+        # when calling get_repos. The dict only needs to be rebuilt if
+        # the configuration was reloaded in the meantime.
+        if self._repo_dict_config is not self._config:
+            self.repo_dict = self._get_repo_dict()
+            self._repo_dict_config = self._config
         return list(self.repo_dict.values())
 
     def get_repo(self, name):
@@ -113,11 +131,24 @@ class Config:
             Returns a `Repo` instance for the configuration with the key
             `name`.
         """
-        repo_defaults = self._config.get('defaults', {}).get('repos', {})
-        overrides = self._config.get('overrides', {}) \
-                                .get('repos', {}).get(name, {})
+        return self._get_repo(name, *self._get_repo_settings())
+
+    def _get_repo_settings(self):
+        """
+            Returns the repo defaults, the repo overrides and the top repo
+            path, which are shared by all repos of the configuration.
+        """
+        return (self._config.get('defaults', {}).get('repos', {}),
+                self._config.get('overrides', {}).get('repos', {}),
+                self.handler.get_top_repo_path())
+
+    def _get_repo(self, name, repo_defaults, repo_overrides, top_repo_path):
+        """
+            Returns a `Repo` instance for the configuration with the key
+            `name`, using the given shared settings.
+        """
+        overrides = repo_overrides.get(name, {})
         config = self.get_repos_config()[name] or {}
-        top_repo_path = self.handler.get_top_repo_path()
 
         # Check if we have this repo with an identical config already.
         # As this function is called across various places and with different
@@ -131,7 +162,7 @@ class Config:
             Get a repo from the cache and insert it if not existing.
             Creating repos is expensive due to external commands being called.
         """
-        encoded = json.dumps(args, sort_keys=True).encode()
+        encoded = _REPO_KEY_ENCODER.encode(args)
         if encoded in self.repo_cfg_hashes:
             return self.repo_cfg_hashes[encoded]
         repo = Repo.factory(*args)
@@ -144,7 +175,9 @@ class Config:
             their names (as it is defined in the config file) as keys
             and the `Repo` instances as values.
         """
-        return {name: self.get_repo(name) for name in self.get_repos_config()}
+        settings = self._get_repo_settings()
+        return {name: self._get_repo(name, *settings)
+                for name in self.get_repos_config()}
 
     def get_bitbake_targets(self):
         """
@@ -153,12 +186,11 @@ class Config:
         if self._override_target:
             return self._override_target
         environ_targets = [i
-                           for i in os.environ.get('KAS_TARGET', '').split()
+                           for i in self._environ.get('KAS_TARGET', '').split()
                            if i]
         if environ_targets:
             return environ_targets
-        def_target = CONFIGSCHEMA['properties']['target']['default']
-        target = self._config.get('target', def_target)
+        target = self._config.get('target', DEFAULT_TARGET)
         if isinstance(target, str):
             return [target]
         return target
@@ -169,18 +201,17 @@ class Config:
         """
         if self._override_task:
             return self._override_task
-        default = CONFIGSCHEMA['properties']['task']['default']
-        return os.environ.get('KAS_TASK',
-                              self._config.get('task', default))
+        if 'KAS_TASK' in self._environ:
+            return self._environ['KAS_TASK']
+        return self._config.get('task', DEFAULT_TASK)
 
     def _get_conf_header(self, header_name):
         """
             Returns the local.conf header
         """
-        header = ''
-        for key, value in sorted(self._config.get(header_name, {}).items()):
-            header += f'# {key}\n{value}\n'
-        return header
+        headers = self._config.get(header_name, {})
+        return ''.join(f'# {key}\n{value}\n'
+                       for key, value in sorted(headers.items()))
 
     def get_bblayers_conf_header(self):
         """
@@ -198,34 +229,37 @@ class Config:
         """
             Returns the machine
         """
-        default = CONFIGSCHEMA['properties']['machine']['default']
-        return os.environ.get('KAS_MACHINE',
-                              self._config.get('machine', default))
+        if 'KAS_MACHINE' in self._environ:
+            return self._environ['KAS_MACHINE']
+        return self._config.get('machine', DEFAULT_MACHINE)
 
     def get_distro(self):
         """
             Returns the distro
         """
-        default = CONFIGSCHEMA['properties']['distro']['default']
-        return os.environ.get('KAS_DISTRO',
-                              self._config.get('distro', default))
+        if 'KAS_DISTRO' in self._environ:
+            return self._environ['KAS_DISTRO']
+        return self._config.get('distro', DEFAULT_DISTRO)
 
     def get_environment(self):
         """
             Returns the configured environment variables from the configuration
             file with possible overwritten values from the environment.
         """
-        env = self._config.get('env', {})
-        return {var: os.environ.get(var, env[var]) for var in env}
+        env = self._config.get('env', None)
+        if not env:
+            return {}
+        return {var: self._environ.get(var, value)
+                for var, value in env.items()}
 
     def get_multiconfig(self):
         """
             Returns the multiconfig array as bitbake string
         """
-        multiconfigs = set()
-        for target in self.get_bitbake_targets():
-            if target.startswith('multiconfig:') or target.startswith('mc:'):
-                multiconfigs.add(target.split(':')[1])
+        # dict keeps the first occurrence order, so the output is stable
+        multiconfigs = dict.fromkeys(
+            target.split(':', 2)[1] for target in self.get_bitbake_targets()
+            if target.startswith(('multiconfig:', 'mc:')))
         return ' '.join(multiconfigs)
 
     def get_artifacts(self, missing_ok=True):
@@ -236,11 +270,12 @@ class Config:
             artifact for a given name is found.
         """
         arts = self._config.get('artifacts', {})
+        build_dir = Path(self._build_dir)
         foundfiles = []
         for name, art in arts.items():
-            files = list(Path(self._build_dir).glob(art))
+            files = list(build_dir.glob(art))
             if not missing_ok and len(files) == 0:
                 raise ArtifactNotFoundError(name, art)
             foundfiles.extend([(name, f) for f in files])
-        return [(n, f.relative_to(self._build_dir))
+        return [(n, f.relative_to(build_dir))
                 for n, f in foundfiles]
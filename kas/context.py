@@ -25,12 +25,14 @@
 
 import os
 import logging
+import functools
 from enum import Enum
 from kas.kasusererror import KasUserError
 
 try:
     import distro
 
+    @functools.lru_cache(maxsize=None)
     def get_distro_id_base():
         """
             Returns a compatible distro id.
@@ -40,6 +42,7 @@ try:
 except ImportError:
     import platform
 
+    @functools.lru_cache(maxsize=None)
     def get_distro_id_base():
         """
             Wrapper around platform.dist to simulate distro.id
@@ -49,6 +52,44 @@ except ImportError:
         return platform.dist()[0]
 
 
+_LOCALE_ENVIRON_FEDORA = {'LC_ALL': 'en_US.utf8',
+                          'LANG': 'en_US.utf8',
+                          'LANGUAGE': 'en_US'}
+_LOCALE_ENVIRON_DEBIAN = {'LC_ALL': 'en_US.UTF-8',
+                          'LANG': 'en_US.UTF-8',
+                          'LANGUAGE': 'en_US:en'}
+DISTRO_LOCALE_ENVIRON = {
+    'fedora': _LOCALE_ENVIRON_FEDORA,
+    'suse': _LOCALE_ENVIRON_FEDORA,
+    'opensuse': _LOCALE_ENVIRON_FEDORA,
+    'debian': _LOCALE_ENVIRON_DEBIAN,
+    'ubuntu': _LOCALE_ENVIRON_DEBIAN,
+    'gentoo': _LOCALE_ENVIRON_DEBIAN,
+}
+
+# Variables passed on from the calling environment to the processes
+# started by kas
+PASSTHROUGH_ENVIRON_VARS = ('http_proxy', 'https_proxy', 'ftp_proxy',
+                            'no_proxy', 'SSH_AUTH_SOCK',
+                            'BB_NUMBER_THREADS', 'PARALLEL_MAKE')
+
+
+@functools.lru_cache(maxsize=None)
+def get_distro_environ():
+    """
+        Returns the default locale settings of the host distribution.
+        As the distribution does not change, it is only detected once.
+    """
+    distro_bases = get_distro_id_base().lower().split()
+    for distro_base in distro_bases:
+        environ = DISTRO_LOCALE_ENVIRON.get(distro_base, None)
+        if environ is not None:
+            return environ
+    logging.warning('kas: No supported distros found in %s. '
+                    'No default locales set.', distro_bases)
+    return {}
+
+
 __context__ = None
 
 
@@ -103,6 +144,7 @@ class Context:
         if not clone_depth.isdigit():
             raise KasUserError('KAS_CLONE_DEPTH must be a number')
         self.repo_clone_depth = max(int(clone_depth), 0)
+        self.__managed_env = self._get_managed_env()
         self.setup_initial_environ()
         self.config = None
         self.args = args
@@ -112,26 +154,9 @@ class Context:
             Sets the environment variables for processes that are
             started by kas.
         """
-        self.environ = {}
-        distro_bases = get_distro_id_base().lower().split()
-        for distro_base in distro_bases:
-            if distro_base in ['fedora', 'suse', 'opensuse']:
-                self.environ = {'LC_ALL': 'en_US.utf8',
-                                'LANG': 'en_US.utf8',
-                                'LANGUAGE': 'en_US'}
-                break
-            elif distro_base in ['debian', 'ubuntu', 'gentoo']:
-                self.environ = {'LC_ALL': 'en_US.UTF-8',
-                                'LANG': 'en_US.UTF-8',
-                                'LANGUAGE': 'en_US:en'}
-                break
-        if self.environ == {}:
-            logging.warning('kas: No supported distros found in %s. '
-                            'No default locales set.', distro_bases)
-
-        for key in ['http_proxy', 'https_proxy', 'ftp_proxy', 'no_proxy',
-                    'SSH_AUTH_SOCK',
-                    'BB_NUMBER_THREADS', 'PARALLEL_MAKE']:
+        self.environ = dict(get_distro_environ())
+
+        for key in PASSTHROUGH_ENVIRON_VARS:
             val = os.environ.get(key, None)
             if val:
                 self.environ[key] = val
@@ -187,4 +212,4 @@ class Context:
 
     @property
     def managed_env(self):
-        return self._get_managed_env()
+        return self.__managed_env
@@ -31,9 +31,18 @@ from collections import OrderedDict
 from collections.abc import Mapping
 import functools
 import logging
-import json
 import yaml
 
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader
+
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
+
 from jsonschema.validators import validator_for
 
 from .kasusererror import KasUserError
@@ -55,27 +64,63 @@ class LoadConfigException(KasUserError):
         super().__init__(f'{message}: {filename}')
 
 
+def _yaml_loads(data):
+    return yaml.load(data, Loader=SafeLoader)
+
+
+CONFIG_PARSERS = {
+    '.json': json_loads,
+    '.yml': _yaml_loads,
+    '.yaml': _yaml_loads,
+}
+
+
+def _copy_config(config):
+    """
+        Returns a deep copy of a parsed configuration. Only the containers
+        created by the parsers are copied, all other values are immutable.
+    """
+    if isinstance(config, dict):
+        return {key: _copy_config(val) for key, val in config.items()}
+    if isinstance(config, list):
+        return [_copy_config(val) for val in config]
+    if isinstance(config, set):
+        return set(config)
+    return config
+
+
+_validator = None
+
+
+def _get_validator():
+    """
+        Returns the validator for the configuration schema. It is only
+        created again if the schema object was replaced.
+    """
+    global _validator
+    if _validator is None or _validator.schema is not CONFIGSCHEMA:
+        validator_class = validator_for(CONFIGSCHEMA)
+        _validator = validator_class(CONFIGSCHEMA)
+    return _validator
+
+
 def load_config(filename):
     """
         Load the configuration file and test if version is supported.
     """
     (_, ext) = os.path.splitext(filename)
-    config = None
-    if ext == '.json':
-        with open(filename, 'rb') as fds:
-            config = json.load(fds)
-    elif ext in ['.yml', '.yaml']:
-        with open(filename, 'rb') as fds:
-            config = yaml.safe_load(fds)
-    else:
+    parser = CONFIG_PARSERS.get(ext, None)
+    if parser is None:
         raise LoadConfigException('Config file extension not recognized',
                                   filename)
 
-    validator_class = validator_for(CONFIGSCHEMA)
-    validator = validator_class(CONFIGSCHEMA)
+    # read the file at once (unbuffered) and parse from memory
+    with open(filename, 'rb', buffering=0) as fds:
+        config = parser(fds.read())
+
     validation_error = False
 
-    for error in validator.iter_errors(config):
+    for error in _get_validator().iter_errors(config):
         validation_error = True
         logging.error('Config file validation Error:\n%s', error)
 
@@ -138,6 +183,7 @@ class IncludeHandler:
         self.top_files = top_files
         self.top_repo_path = top_repo_path
         self.use_lock = use_lock
+        self._config_cache = {}
 
     def get_lockfile(self, kasfile=None):
         file = Path(kasfile or self.top_files[0])
@@ -146,6 +192,22 @@ class IncludeHandler:
     def get_top_repo_path(self):
         return self.top_repo_path
 
+    def _load_config(self, filename):
+        """
+            Wrapper around load_config that reuses the result of a previous
+            load of the same file as long as it was not modified.
+        """
+        try:
+            st = os.stat(filename)
+        except OSError:
+            return load_config(filename)
+        key = (os.fspath(filename), st.st_mtime_ns, st.st_size)
+        if key not in self._config_cache:
+            self._config_cache[key] = load_config(filename)
+        (config, src_dir) = self._config_cache[key]
+        # callers may modify the returned config
+        return (_copy_config(config), src_dir)
+
     def get_config(self, repos=None):
         """
         Parameters:
@@ -189,7 +251,7 @@ class IncludeHandler:
             missing_repos = []
             configs = []
             try:
-                current_config, src_dir = load_config(filename)
+                current_config, src_dir = self._load_config(filename)
                 # if lockfile exists and locking, inject it after current file
                 lockfile = self.get_lockfile(filename)
                 if self.use_lock and Path(lockfile).exists():
@@ -239,9 +301,8 @@ class IncludeHandler:
                     includerepo = include.get('repo', None)
                     includedir = repos.get(includerepo, None)
                     if includedir is not None:
-                        try:
-                            includefile = include['file']
-                        except KeyError:
+                        includefile = include.get('file', None)
+                        if includefile is None:
                             raise IncludeException(
                                 f'"file" is not specified: {include}')
                         abs_includedir = os.path.abspath(includedir)
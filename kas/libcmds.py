@@ -34,7 +34,8 @@ import json
 import base64
 from git.config import GitConfigParser
 from .libkas import (ssh_cleanup_agent, ssh_setup_agent, ssh_no_host_key_check,
-                     get_build_environ, repos_fetch, repos_apply_patches)
+                     get_build_environ, repos_fetch, repos_checkout,
+                     repos_apply_patches)
 from .context import ManagedEnvironment as ME
 from .context import get_context
 from .includehandler import IncludeException
@@ -490,6 +491,7 @@ class InitSetupRepos(Command):
     def execute(self, ctx):
         ctx.missing_repo_names = ctx.config.find_missing_repos()
         ctx.missing_repo_names_old = None
+        ctx.repo_paths = {}
 
 
 class SetupReposStep(Command):
@@ -504,13 +506,15 @@ class SetupReposStep(Command):
         if not ctx.missing_repo_names:
             return False
 
-        if ctx.missing_repo_names == ctx.missing_repo_names_old:
+        # the order of the names does not matter for the progress check
+        if frozenset(ctx.missing_repo_names) == ctx.missing_repo_names_old:
             raise IncludeException('Could not fetch all repos needed by '
                                    'includes. Missing repos: {}'
                                    .format(', '.join(ctx.missing_repo_names)))
 
-        logging.debug('Missing repos for complete config:\n%s',
-                      pprint.pformat(ctx.missing_repo_names))
+        if logging.getLogger().isEnabledFor(logging.DEBUG):
+            logging.debug('Missing repos for complete config:\n%s',
+                          pprint.pformat(ctx.missing_repo_names))
 
         ctx.missing_repos = []
         for repo_name in ctx.missing_repo_names:
@@ -521,19 +525,21 @@ class SetupReposStep(Command):
                                       ctx.config.get_repo(repo_name)))
 
         repos_fetch([v for k, v in ctx.missing_repos])
-
-        for _, repo in ctx.missing_repos:
-            repo.checkout()
+        repos_checkout([v for k, v in ctx.missing_repos])
 
         ctx.config.repo_dict.update(
             {id: repo for id, repo in ctx.missing_repos})
 
         repo_paths = {r: ctx.config.repo_dict[r].path for r
                       in ctx.config.repo_dict}
-        ctx.missing_repo_names_old = ctx.missing_repo_names
+        ctx.missing_repo_names_old = frozenset(ctx.missing_repo_names)
 
-        ctx.missing_repo_names = \
-            ctx.config.find_missing_repos(repo_paths)
+        # Without new repos, the config cannot change. Keep the missing
+        # names so that the next step reports them without re-parsing.
+        if repo_paths != ctx.repo_paths:
+            ctx.repo_paths = repo_paths
+            ctx.missing_repo_names = \
+                ctx.config.find_missing_repos(repo_paths)
 
         return ctx.missing_repo_names
 
@@ -550,6 +556,9 @@ class FinishSetupRepos(Command):
         # now fetch everything with complete config
         repos_fetch(ctx.config.get_repos())
 
+        # formatting the whole configuration is costly, skip it if unused
+        if not logging.getLogger().isEnabledFor(logging.DEBUG):
+            return
         if sys.version_info < (3, 8):
             config_str = pprint.pformat(ctx.config.get_config())
         else:
@@ -567,5 +576,4 @@ class ReposCheckout(Command):
         return 'repos_checkout'
 
     def execute(self, ctx):
-        for repo in ctx.config.get_repos():
-            repo.checkout()
+        repos_checkout(ctx.config.get_repos())
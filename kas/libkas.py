@@ -33,6 +33,7 @@ import asyncio
 import errno
 import pathlib
 import signal
+from concurrent.futures import ThreadPoolExecutor
 from subprocess import Popen, PIPE, run as subprocess_run
 from .context import get_context
 from .kasusererror import KasUserError, CommandExecError
@@ -231,6 +232,20 @@ def repos_fetch(repos):
         raise TaskExecError('fetch repos', e.ret_code)
 
 
+def repos_checkout(repos):
+    """
+        Checks out the correct revision of each repository. The repositories
+        are independent of each other, so this is done in parallel.
+    """
+    if len(repos) == 0:
+        return
+
+    workers = min(os.cpu_count() or 1, len(repos))
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        # consume the results to re-raise any error of a checkout
+        list(executor.map(lambda repo: repo.checkout(), repos))
+
+
 def repos_apply_patches(repos):
     """
         Applies the patches to the repositories.
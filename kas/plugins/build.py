@@ -39,7 +39,6 @@
 import logging
 import subprocess
 import sys
-import json
 import asyncio
 from pathlib import Path
 from datetime import datetime
@@ -126,12 +125,10 @@ class BuildCommand(Command):
         """
         predicate = Provenance(ctx, time_started, time_finished,
                                mode)
-        stmt = Statement(predicate, ctx, time_started, time_finished).as_dict()
+        stmt = Statement(predicate, ctx, time_started, time_finished)
         att_dir = Path(ctx.build_dir) / 'attestation'
         att_dir.mkdir(parents=True, exist_ok=True)
-        with open(att_dir / 'kas-build.provenance.json', 'w') as f:
-            f.write(json.dumps(stmt, indent=4))
-            f.write('\n')
+        stmt.write_json(att_dir / 'kas-build.provenance.json')
 
     def execute(self, ctx):
         """
@@ -232,7 +232,8 @@ class Menu:
                 ])
             }
 
-        logging.debug('Menu configuration:\n%s', pprint.pformat(config))
+        if logging.getLogger().isEnabledFor(logging.DEBUG):
+            logging.debug('Menu configuration:\n%s', pprint.pformat(config))
 
         if config != self.orig_config:
             logging.info('Saving configuration as %s', filename)
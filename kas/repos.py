@@ -44,6 +44,10 @@ else:
 __license__ = 'MIT'
 __copyright__ = 'Copyright (c) Siemens AG, 2017-2018'
 
+# Layer values (lower case) that exclude the layer from bblayers.conf
+LAYER_DISABLED_VALUES = frozenset(['disabled', 'excluded', 'n', 'no', '0',
+                                   'false'])
+
 
 class UnsupportedRepoTypeError(KasUserError, NotImplementedError):
     """
@@ -189,10 +193,8 @@ class Repo:
             This factory function is referential transparent.
         """
         layers_dict = repo_config.get('layers', {'': None})
-        layers = list(filter(lambda x, laydict=layers_dict:
-                             str(laydict[x]).lower() not in
-                             ['disabled', 'excluded', 'n', 'no', '0', 'false'],
-                             layers_dict))
+        layers = [layer for layer, value in layers_dict.items()
+                  if str(value).lower() not in LAYER_DISABLED_VALUES]
         default_patch_repo = repo_defaults.get('patches', {}).get('repo', None)
         patches_dict = repo_config.get('patches', {})
         patches = []
@@ -278,6 +280,28 @@ class Repo:
         raise UnsupportedRepoTypeError(f'Repo type "{repo_type}" '
                                        'not supported.')
 
+    @staticmethod
+    def _find_git_toplevel(path):
+        """
+            Walks up from path to the first directory containing a .git
+            directory and returns it, provided that no parent directory
+            contains a .git entry as well. Returns None otherwise, as
+            submodules (with a .git file or directory), worktrees and nested
+            repositories are left to git to resolve.
+        """
+        toplevel = None
+        cur = os.path.realpath(path)
+        while True:
+            git_dir = os.path.join(cur, '.git')
+            if toplevel is None and os.path.isdir(git_dir):
+                toplevel = cur
+            elif os.path.lexists(git_dir):
+                return None
+            parent = os.path.dirname(cur)
+            if parent == cur:
+                return toplevel
+            cur = parent
+
     @staticmethod
     def get_root_path(path, fallback=True):
         """
@@ -285,6 +309,10 @@ class Repo:
             If the repo is a submodule, the root path of the super-repository
             is returned.
         """
+        toplevel = Repo._find_git_toplevel(path)
+        if toplevel:
+            return toplevel
+
         git_cmd = ['git', 'rev-parse', '--show-toplevel',
                    '--show-superproject-working-tree']
         (ret, output) = run_cmd(git_cmd, cwd=path, fail=False)
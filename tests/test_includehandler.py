@@ -382,3 +382,29 @@ v: {v3: z, v4: z}''')}
             assert index['v2'] < index['v1']
             assert index['v3'] < index['v1']
             assert index['v5'] < index['v1']
+
+    def test_config_cache(self, monkeypatch, tmpdir):
+        # disable schema validation for this test:
+        monkeypatch.setattr(includehandler, 'CONFIGSCHEMA', {})
+        loaded = []
+        load_config = includehandler.load_config
+
+        def _load_config(filename):
+            loaded.append(filename)
+            return load_config(filename)
+
+        monkeypatch.setattr(includehandler, 'load_config', _load_config)
+        kasfile = tmpdir / 'x.yml'
+        kasfile.write_text('header: {version: 5}\nv: {v1: x}\n', 'utf-8')
+        ginc = includehandler.IncludeHandler([str(kasfile)], str(tmpdir))
+        config, _ = ginc.get_config()
+        config['v']['v1'] = 'modified'
+        config, _ = ginc.get_config()
+        assert config['v']['v1'] == 'x'
+        assert len(loaded) == 1
+
+        # a modified file must be loaded again
+        kasfile.write_text('header: {version: 5}\nv: {v1: yz}\n', 'utf-8')
+        config, _ = ginc.get_config()
+        assert config['v']['v1'] == 'yz'
+        assert len(loaded) == 2
@@ -0,0 +1,70 @@
+# kas - setup tool for bitbake based projects
+#
+# Copyright (c) Siemens AG, 2026
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be
+# included in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+import os
+import subprocess
+from kas.context import create_global_context
+from kas.repos import Repo
+
+
+def git(cwd, *args):
+    subprocess.check_call(['git', '-c', 'protocol.file.allow=always',
+                           *args], cwd=cwd, stdout=subprocess.DEVNULL)
+
+
+def init_repo(path):
+    os.makedirs(path, exist_ok=True)
+    git(path, 'init', '-q')
+    git(path, 'commit', '-q', '--allow-empty', '-m', 'init')
+    return os.path.realpath(path)
+
+
+def test_root_path_plain_repo(monkeykas, tmpdir):
+    create_global_context([])
+    repo = init_repo(f'{tmpdir}/repo')
+    os.makedirs(f'{repo}/sub/dir')
+
+    assert Repo._find_git_toplevel(f'{repo}/sub/dir') == repo
+    assert Repo.get_root_path(f'{repo}/sub/dir') == repo
+
+
+def test_root_path_submodule_git_file(monkeykas, tmpdir):
+    create_global_context([])
+    upstream = init_repo(f'{tmpdir}/upstream')
+    superrepo = init_repo(f'{tmpdir}/super')
+    git(superrepo, 'submodule', '-q', 'add', upstream, 'sub')
+    assert os.path.isfile(f'{superrepo}/sub/.git')
+
+    assert Repo._find_git_toplevel(f'{superrepo}/sub') is None
+    assert Repo.get_root_path(f'{superrepo}/sub') == superrepo
+
+
+def test_root_path_submodule_git_dir(monkeykas, tmpdir):
+    create_global_context([])
+    superrepo = init_repo(f'{tmpdir}/super')
+    # adding an existing repository keeps its .git directory in place
+    inner = init_repo(f'{superrepo}/inner')
+    git(superrepo, 'submodule', '-q', 'add', inner, 'inner')
+    assert os.path.isdir(f'{inner}/.git')
+
+    assert Repo._find_git_toplevel(inner) is None
+    assert Repo.get_root_path(inner) == superrepo